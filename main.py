@@ -1,5 +1,5 @@
 # SlotBot - Robust Render Build
-# Flask health endpoint + discord.py 2.6.x Slash Commands + persistent buttons (per-event custom_id)
+# aiohttp health endpoint + discord.py 2.6.x Slash Commands + persistent buttons (per-event custom_id)
 
 import os
 import json
@@ -8,12 +8,23 @@ import threading
 import uuid
 import random
 from datetime import datetime, timedelta, timezone
+from functools import lru_cache
 from pathlib import Path
 from typing import Optional, Dict, Any, List
 
 import discord
+from aiohttp import web
 from discord import app_commands
-from flask import Flask
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import uvloop
+except ImportError:
+    uvloop = None
 
 # =========================
 # Config
@@ -27,35 +38,82 @@ DEV_GUILD_ID = os.environ.get("DEV_GUILD_ID", "").strip()
 DEV_GUILD = discord.Object(id=int(DEV_GUILD_ID)) if DEV_GUILD_ID.isdigit() else None
 
 # =========================
-# Flask (Render Web Service)
+# Health endpoint (Render Web Service)
 # =========================
-app = Flask("slotbot")
-
-@app.get("/")
-def index():
-    return "SlotBot is running.", 200
-
-def run_flask():
-    # reloader OFF to avoid double-start
-    app.run(host="0.0.0.0", port=PORT, debug=False, use_reloader=False)
+# Served by aiohttp on the bot's own event loop -> no extra thread, no Flask
+async def index(request: web.Request) -> web.Response:
+    return web.Response(text="SlotBot is running.")
+
+async def start_web() -> web.AppRunner:
+    app = web.Application()
+    app.router.add_get("/", index)
+    runner = web.AppRunner(app)
+    await runner.setup()
+    await web.TCPSite(runner, host="0.0.0.0", port=PORT).start()
+    return runner
 
 # =========================
 # Persistence
 # =========================
+def _dumps(obj: Any) -> bytes:
+    # orjson is a C encoder and much faster; stdlib json stays as fallback
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2)
+    return json.dumps(obj, ensure_ascii=False, indent=2).encode("utf-8")
+
+def _loads(data: bytes) -> Any:
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data.decode("utf-8"))
+
 def load_events() -> Dict[str, Dict[str, Any]]:
     if not DATA_FILE.exists():
         return {}
     try:
-        return json.loads(DATA_FILE.read_text(encoding="utf-8"))
+        return _loads(DATA_FILE.read_bytes())
     except Exception:
         return {}
 
-def save_events(events: Dict[str, Dict[str, Any]]) -> None:
+# Never interleave two writers on the shared temp file
+_write_lock = threading.Lock()
+
+def _write_events(data: bytes) -> None:
+    tmp = DATA_FILE.with_name(DATA_FILE.name + ".tmp")
     try:
-        DATA_FILE.write_text(json.dumps(events, ensure_ascii=False, indent=2), encoding="utf-8")
+        with _write_lock:
+            with open(tmp, "wb") as f:
+                f.write(data)
+                f.flush()
+                # Data must be on disk before the rename, or a power loss can still leave an empty file
+                os.fsync(f.fileno())
+            # Atomic swap: a crash mid-write never leaves a truncated events.json
+            os.replace(tmp, DATA_FILE)
     except Exception as e:
         print("⚠️  Could not save events:", e)
 
+def save_events(events: Dict[str, Dict[str, Any]]) -> None:
+    _write_events(_dumps(events))
+
+# Coalesced saves: async code only flags the state dirty, saver_loop writes once per burst.
+# save_events() itself is for synchronous contexts (shutdown flush).
+SAVE_DELAY = 1.0
+_save_requested = asyncio.Event()
+
+def request_save() -> None:
+    _save_requested.set()
+
+async def saver_loop():
+    while True:
+        await _save_requested.wait()
+        await asyncio.sleep(SAVE_DELAY)
+        _save_requested.clear()
+        try:
+            # Serialize on the loop (consistent snapshot), write to disk off the loop
+            data = _dumps(EVENTS)
+            await asyncio.to_thread(_write_events, data)
+        except Exception as e:
+            print("⚠️ Saver error:", e)
+
 EVENTS: Dict[str, Dict[str, Any]] = load_events()
 print(f"✅ {len(EVENTS)} gespeicherte Events geladen.")
 
@@ -69,6 +127,7 @@ client = discord.Client(intents=intents)
 tree = app_commands.CommandTree(client)
 
 _scheduler_task: Optional[asyncio.Task] = None
+_saver_task: Optional[asyncio.Task] = None
 
 # =========================
 # Time helpers
@@ -76,6 +135,14 @@ _scheduler_task: Optional[asyncio.Task] = None
 def now_utc() -> datetime:
     return datetime.now(timezone.utc)
 
+@lru_cache(maxsize=256)
+def _parse_start(iso: str) -> datetime:
+    return datetime.fromisoformat(iso).astimezone(timezone.utc)
+
+def event_start(ev: Dict[str, Any]) -> datetime:
+    # start_utc stays an ISO string in events.json; parse each distinct value once
+    return _parse_start(ev["start_utc"])
+
 def parse_dt_utc(dt_str: str) -> datetime:
     """
     Accepts:
@@ -140,17 +207,17 @@ async def fetch_channel(guild: discord.Guild, channel_id: int):
             return None
     return ch
 
-async def fetch_message(channel: discord.abc.Messageable, message_id: int):
-    try:
-        return await channel.fetch_message(message_id)
-    except Exception:
-        return None
+def event_message(guild: discord.Guild, ev: Dict[str, Any]) -> discord.PartialMessage:
+    # Edit/delete only need the ids: a PartialMessage skips the channel/message GETs
+    channel_id = int(ev["channel_id"])
+    channel = guild.get_channel(channel_id) or client.get_partial_messageable(channel_id, guild_id=guild.id)
+    return channel.get_partial_message(int(ev["message_id"]))
 
 # =========================
 # Event rendering
 # =========================
 def event_embed(ev: Dict[str, Any]) -> discord.Embed:
-    start_dt = datetime.fromisoformat(ev["start_utc"]).astimezone(timezone.utc)
+    start_dt = event_start(ev)
     slots = int(ev["slots"])
     participants: List[int] = ev.get("participants", [])
     waitlist: List[int] = ev.get("waitlist", [])
@@ -172,13 +239,28 @@ def event_embed(ev: Dict[str, Any]) -> discord.Embed:
     emb.set_footer(text=f"Event-ID: {ev['event_id']}")
     return emb
 
+def remove_id(ids: List[int], uid: int) -> bool:
+    # Single scan instead of `uid in ids` followed by `ids.remove(uid)`
+    try:
+        ids.remove(uid)
+        return True
+    except ValueError:
+        return False
+
+# (opens, closes) before start for each channel reminder
+REMINDER_WINDOWS = {
+    "60": (timedelta(minutes=60), timedelta(minutes=59, seconds=30)),
+    "30": (timedelta(minutes=30), timedelta(minutes=29, seconds=30)),
+}
+FINALIZE_BEFORE = timedelta(minutes=10)
+
 def afk_open(ev: Dict[str, Any], t: datetime) -> bool:
-    start = datetime.fromisoformat(ev["start_utc"]).astimezone(timezone.utc)
+    start = event_start(ev)
     return (start - timedelta(minutes=30)) <= t <= start
 
 def afk_finalize_window(ev: Dict[str, Any], t: datetime) -> bool:
-    start = datetime.fromisoformat(ev["start_utc"]).astimezone(timezone.utc)
-    return (start - timedelta(minutes=10)) <= t <= start
+    start = event_start(ev)
+    return (start - FINALIZE_BEFORE) <= t <= start
 
 async def ensure_thread(message: discord.Message, ev: Dict[str, Any]) -> Optional[discord.Thread]:
     tid = ev.get("thread_id")
@@ -196,27 +278,54 @@ async def ensure_thread(message: discord.Message, ev: Dict[str, Any]) -> Optiona
     try:
         th = await message.create_thread(name=f"🧵 {ev['title']}", auto_archive_duration=1440)
         ev["thread_id"] = th.id
-        save_events(EVENTS)
+        request_save()
         return th
     except Exception as e:
         print("⚠️ thread create failed:", e)
         return None
 
+# Hash of the last embed successfully sent per event (runtime only, not persisted)
+_last_render: Dict[str, int] = {}
+
 async def refresh_event_message(guild: discord.Guild, ev: Dict[str, Any]) -> None:
-    channel = await fetch_channel(guild, int(ev["channel_id"]))
-    if not channel:
-        return
-    msg = await fetch_message(channel, int(ev["message_id"]))
-    if not msg:
+    emb = event_embed(ev)
+    digest = hash(_dumps(emb.to_dict()))
+    if _last_render.get(ev["event_id"]) == digest:
+        # Nothing visible changed -> skip the edit (PATCH) round-trip
         return
+
     try:
-        await msg.edit(embed=event_embed(ev), view=EventView(ev["event_id"]))
+        await event_message(guild, ev).edit(embed=emb, view=EventView(ev["event_id"]))
+        _last_render[ev["event_id"]] = digest
     except Exception as e:
         print("⚠️ message edit failed:", e)
 
+# Coalesced edits: a burst of button presses on one event results in a single edit
+REFRESH_DELAY = 0.4
+_refresh_tasks: Dict[str, asyncio.Task] = {}
+
+def schedule_refresh(guild: discord.Guild, ev: Dict[str, Any]) -> None:
+    ev_id = ev["event_id"]
+    task = _refresh_tasks.get(ev_id)
+    if task is not None and not task.done():
+        # The pending edit renders whatever state is current when it fires
+        return
+
+    async def run():
+        await asyncio.sleep(REFRESH_DELAY)
+        # Unregister before editing so changes made during the edit schedule a new one
+        _refresh_tasks.pop(ev_id, None)
+        current = EVENTS.get(ev_id)
+        if current is not None:
+            await refresh_event_message(guild, current)
+
+    _refresh_tasks[ev_id] = asyncio.create_task(run())
+
 # =========================
 # UI View (IMPORTANT: per-event custom_id)
 # =========================
+EVENT_ACTIONS = frozenset({"join", "leave", "afk"})
+
 def cid(action: str, ev_id: str) -> str:
     # Unique custom_id per event to prevent persistent-view collisions
     return f"slotbot:{action}:{ev_id}"
@@ -251,6 +360,11 @@ async def on_interaction(interaction: discord.Interaction):
             return
 
         _, action, ev_id = parts
+        # Stray action: answer directly, skipping the event lookup and the defer round-trip
+        if action not in EVENT_ACTIONS:
+            await safe_send(interaction, content="❌ Unbekannte Aktion.", ephemeral=True)
+            return
+
         ev = EVENTS.get(ev_id)
         await safe_defer(interaction, ephemeral=True)
 
@@ -278,35 +392,32 @@ async def on_interaction(interaction: discord.Interaction):
                 waitlist.append(uid)
                 msg_txt = "⏳ Event voll – du bist auf der Warteliste."
 
-            save_events(EVENTS)
+            request_save()
             if interaction.guild:
-                await refresh_event_message(interaction.guild, ev)
+                schedule_refresh(interaction.guild, ev)
             await safe_send(interaction, content=msg_txt, ephemeral=True)
             return
 
         if action == "leave":
-            afk_checked = set(ev.get("afk_checked", []))
-            removed = False
+            in_participants = remove_id(participants, uid)
+            in_waitlist = remove_id(waitlist, uid)
+            removed = in_participants or in_waitlist
+            remove_id(ev.get("afk_checked", []), uid)
 
-            if uid in participants:
-                participants.remove(uid)
-                removed = True
-            if uid in waitlist:
-                waitlist.remove(uid)
-                removed = True
-            if uid in afk_checked:
-                afk_checked.discard(uid)
-                ev["afk_checked"] = list(afk_checked)
+            changed = removed
 
             # promote from waitlist if free slot
             slots = int(ev["slots"])
             if len(participants) < slots and waitlist:
                 promoted = waitlist.pop(0)
                 participants.append(promoted)
+                changed = True
 
-            save_events(EVENTS)
-            if interaction.guild:
-                await refresh_event_message(interaction.guild, ev)
+            # Pressing "Leave" without being signed up must not cost a save + message edit
+            if changed:
+                request_save()
+                if interaction.guild:
+                    schedule_refresh(interaction.guild, ev)
 
             await safe_send(interaction, content=("🚪 Du bist raus." if removed else "Du warst nicht eingetragen."), ephemeral=True)
             return
@@ -321,13 +432,13 @@ async def on_interaction(interaction: discord.Interaction):
                 await safe_send(interaction, content="Du bist nicht in der Teilnehmerliste.", ephemeral=True)
                 return
 
-            afk_checked = set(ev.get("afk_checked", []))
-            afk_checked.add(uid)
-            ev["afk_checked"] = list(afk_checked)
-            save_events(EVENTS)
+            afk_checked = ev.setdefault("afk_checked", [])
+            if uid not in afk_checked:
+                afk_checked.append(uid)
+                request_save()
 
-            if interaction.guild:
-                await refresh_event_message(interaction.guild, ev)
+                if interaction.guild:
+                    schedule_refresh(interaction.guild, ev)
             await safe_send(interaction, content="✅ AFK-Check bestätigt.", ephemeral=True)
             return
 
@@ -337,82 +448,137 @@ async def on_interaction(interaction: discord.Interaction):
 # =========================
 # Background Scheduler
 # =========================
+SCHEDULER_RETRY = 10.0       # seconds; re-check while a due job could not be handled
+SCHEDULER_MAX_SLEEP = 3600.0
+
+_scheduler_wakeup = asyncio.Event()
+
+def wake_scheduler() -> None:
+    # Call after events are created/edited so the next deadline is recomputed
+    _scheduler_wakeup.set()
+
+def next_deadline(ev: Dict[str, Any], t: datetime) -> Optional[datetime]:
+    """Earliest window start of a job that is still pending and whose window has not closed."""
+    start = event_start(ev)
+    sent = ev.get("reminders_sent", [])
+    candidates = [
+        start - opens
+        for key, (opens, closes) in REMINDER_WINDOWS.items()
+        if key not in sent and t <= start - closes
+    ]
+    if not ev.get("afk_finalized", False) and t <= start:
+        candidates.append(start - FINALIZE_BEFORE)
+    return min(candidates, default=None)
+
+async def process_event(ev: Dict[str, Any], t: datetime) -> bool:
+    """Run due reminders / AFK finalize for one event. Returns True if ev was changed."""
+    if not isinstance(ev, dict) or "guild_id" not in ev or "start_utc" not in ev:
+        return False
+
+    guild = client.get_guild(int(ev["guild_id"]))
+    if guild is None:
+        return False
+
+    channel = await fetch_channel(guild, int(ev["channel_id"]))
+    if channel is None:
+        return False
+
+    start = event_start(ev)
+    sent = set(ev.get("reminders_sent", []))
+    changed = False
+
+    async def send_once(key: str, text: str):
+        nonlocal changed
+        if key in sent:
+            return
+        try:
+            await channel.send(text)
+            sent.add(key)
+            ev["reminders_sent"] = list(sent)
+            changed = True
+        except Exception as e:
+            print("⚠️ reminder send failed:", e)
+
+    # 60 min reminder
+    opens, closes = REMINDER_WINDOWS["60"]
+    if (start - opens) <= t <= (start - closes):
+        await send_once("60", f"⏰ Erinnerung: **{ev['title']}** startet in 60 Minuten. AFK-Check ab 30 Minuten vor Start!")
+
+    # 30 min reminder
+    opens, closes = REMINDER_WINDOWS["30"]
+    if (start - opens) <= t <= (start - closes):
+        await send_once("30", f"🟡 AFK-Check offen: **{ev['title']}**. Bitte jetzt bestätigen!")
+
+    # finalize 10 min before (once)
+    if afk_finalize_window(ev, t) and not ev.get("afk_finalized", False):
+        participants: List[int] = ev.get("participants", [])
+        waitlist: List[int] = ev.get("waitlist", [])
+        slots = int(ev["slots"])
+        afk_checked = set(ev.get("afk_checked", []))
+
+        kicked = [uid for uid in participants if uid not in afk_checked]
+        kept = [uid for uid in participants if uid in afk_checked]
+
+        # Promote in one slice instead of repeated O(n) pop(0)
+        free = max(0, slots - len(kept))
+        kept.extend(waitlist[:free])
+        del waitlist[:free]
+
+        ev["participants"] = kept
+        ev["waitlist"] = waitlist
+        ev["afk_finalized"] = True
+        changed = True
+
+        try:
+            if kicked:
+                await channel.send("🚫 AFK-Check nicht bestanden, raus: " + " ".join([f"<@{u}>" for u in kicked]))
+            await channel.send("✅ Teilnehmerliste aktualisiert. (Nachrücker wurden ggf. gezogen.)")
+        except Exception as e:
+            print("⚠️ finalize announce failed:", e)
+
+        await refresh_event_message(guild, ev)
+
+    return changed
+
 async def scheduler_loop():
     print("⏱️ Scheduler gestartet.")
     while True:
+        delay = SCHEDULER_RETRY  # also used if this pass raises
         try:
             t = now_utc()
-            changed = False
-
-            for ev_id, ev in list(EVENTS.items()):
-                if not isinstance(ev, dict) or "guild_id" not in ev or "start_utc" not in ev:
-                    continue
-
-                guild = client.get_guild(int(ev["guild_id"]))
-                if guild is None:
-                    continue
-
-                channel = await fetch_channel(guild, int(ev["channel_id"]))
-                if channel is None:
-                    continue
-
-                start = datetime.fromisoformat(ev["start_utc"]).astimezone(timezone.utc)
-                sent = set(ev.get("reminders_sent", []))
-
-                async def send_once(key: str, text: str):
-                    nonlocal changed
-                    if key in sent:
-                        return
-                    try:
-                        await channel.send(text)
-                        sent.add(key)
-                        ev["reminders_sent"] = list(sent)
-                        changed = True
-                    except Exception as e:
-                        print("⚠️ reminder send failed:", e)
-
-                # 60 min reminder
-                if (start - timedelta(minutes=60)) <= t <= (start - timedelta(minutes=59, seconds=30)):
-                    await send_once("60", f"⏰ Erinnerung: **{ev['title']}** startet in 60 Minuten. AFK-Check ab 30 Minuten vor Start!")
-
-                # 30 min reminder
-                if (start - timedelta(minutes=30)) <= t <= (start - timedelta(minutes=29, seconds=30)):
-                    await send_once("30", f"🟡 AFK-Check offen: **{ev['title']}**. Bitte jetzt bestätigen!")
-
-                # finalize 10 min before (once)
-                if afk_finalize_window(ev, t) and not ev.get("afk_finalized", False):
-                    participants: List[int] = ev.get("participants", [])
-                    waitlist: List[int] = ev.get("waitlist", [])
-                    slots = int(ev["slots"])
-                    afk_checked = set(ev.get("afk_checked", []))
-
-                    kicked = [uid for uid in participants if uid not in afk_checked]
-                    kept = [uid for uid in participants if uid in afk_checked]
-
-                    while len(kept) < slots and waitlist:
-                        kept.append(waitlist.pop(0))
-
-                    ev["participants"] = kept
-                    ev["waitlist"] = waitlist
-                    ev["afk_finalized"] = True
-                    changed = True
-
-                    try:
-                        if kicked:
-                            await channel.send("🚫 AFK-Check nicht bestanden, raus: " + " ".join([f"<@{u}>" for u in kicked]))
-                        await channel.send("✅ Teilnehmerliste aktualisiert. (Nachrücker wurden ggf. gezogen.)")
-                    except Exception as e:
-                        print("⚠️ finalize announce failed:", e)
-
-                    await refresh_event_message(guild, ev)
+
+            # Events are independent: overlap their Discord round-trips
+            results = await asyncio.gather(
+                *(process_event(ev, t) for ev in list(EVENTS.values())),
+                return_exceptions=True,
+            )
+            for res in results:
+                if isinstance(res, Exception):
+                    print("⚠️ Scheduler event error:", res)
+            changed = any(res is True for res in results)
 
             if changed:
-                save_events(EVENTS)
+                request_save()
+
+            # Sleep until the next window opens instead of polling
+            deadlines = [
+                d for ev in EVENTS.values()
+                if isinstance(ev, dict) and "start_utc" in ev and (d := next_deadline(ev, t)) is not None
+            ]
+            future = [d for d in deadlines if d > t]
+            delay = (min(future) - now_utc()).total_seconds() if future else SCHEDULER_MAX_SLEEP
+            if len(future) < len(deadlines):
+                # A job was due in this pass but not handled (no guild/channel, send failed) -> retry soon
+                delay = min(delay, SCHEDULER_RETRY)
 
         except Exception as e:
             print("⚠️ Scheduler error:", e)
 
-        await asyncio.sleep(10)
+        try:
+            await asyncio.wait_for(_scheduler_wakeup.wait(), timeout=min(max(delay, 0.0), SCHEDULER_MAX_SLEEP))
+        except asyncio.TimeoutError:
+            pass
+        _scheduler_wakeup.clear()
 
 # =========================
 # Slash Commands
@@ -471,15 +637,9 @@ async def event_create(interaction: discord.Interaction, title: str, start_utc:
     msg = await channel.send(embed=event_embed(ev), view=EventView(ev_id))
     ev["message_id"] = msg.id
 
-    th = await ensure_thread(msg, ev)
-    if th:
-        try:
-            await th.send("🧵 Thread erstellt. Hier kann alles zum Event besprochen werden.")
-        except Exception:
-            pass
-
     EVENTS[ev_id] = ev
-    save_events(EVENTS)
+    request_save()
+    wake_scheduler()
 
     # Register persistent view for this event immediately (so it survives restarts)
     try:
@@ -487,8 +647,16 @@ async def event_create(interaction: discord.Interaction, title: str, start_utc:
     except Exception:
         pass
 
+    # Confirm first; thread setup is secondary and must not hold up the followup
     await safe_send(interaction, content=f"✅ Event erstellt: **{title}** (ID: `{ev_id}`)", ephemeral=False)
 
+    th = await ensure_thread(msg, ev)
+    if th:
+        try:
+            await th.send("🧵 Thread erstellt. Hier kann alles zum Event besprochen werden.")
+        except Exception:
+            pass
+
 @event_group.command(name="edit", description="Event bearbeiten")
 @app_commands.describe(event_id="Event-ID", title="Neuer Titel (optional)", start_utc="Neue Startzeit UTC (optional)", slots="Neue Slot-Anzahl (optional)")
 async def event_edit(interaction: discord.Interaction, event_id: str, title: Optional[str] = None, start_utc: Optional[str] = None, slots: Optional[int] = None):
@@ -516,12 +684,14 @@ async def event_edit(interaction: discord.Interaction, event_id: str, title: Opt
         ev["slots"] = new_slots
         participants: List[int] = ev.get("participants", [])
         waitlist: List[int] = ev.get("waitlist", [])
-        while len(participants) > new_slots:
-            waitlist.insert(0, participants.pop())
+        # Overflow goes to the front of the waitlist, original order kept
+        waitlist[:0] = participants[new_slots:]
+        del participants[new_slots:]
         ev["participants"] = participants
         ev["waitlist"] = waitlist
 
-    save_events(EVENTS)
+    request_save()
+    wake_scheduler()
 
     guild = client.get_guild(int(ev["guild_id"]))
     if guild:
@@ -541,33 +711,27 @@ async def event_delete(interaction: discord.Interaction, event_id: str):
 
     guild = client.get_guild(int(ev["guild_id"]))
     if guild:
-        channel = await fetch_channel(guild, int(ev["channel_id"]))
-        if channel:
-            msg = await fetch_message(channel, int(ev["message_id"]))
-            if msg:
-                try:
-                    await msg.delete()
-                except Exception:
-                    pass
-
-        tid = ev.get("thread_id")
-        if tid:
+        async def delete_message():
+            await event_message(guild, ev).delete()
+
+        async def delete_thread():
+            tid = ev.get("thread_id")
+            if not tid:
+                return
             th = guild.get_thread(int(tid))
             if th is None:
-                try:
-                    ch = await guild.fetch_channel(int(tid))
-                    if isinstance(ch, discord.Thread):
-                        th = ch
-                except Exception:
-                    th = None
+                ch = await guild.fetch_channel(int(tid))
+                if isinstance(ch, discord.Thread):
+                    th = ch
             if th:
-                try:
-                    await th.delete()
-                except Exception:
-                    pass
+                await th.delete()
+
+        # Independent REST calls: run them concurrently, failures are ignored as before
+        await asyncio.gather(delete_message(), delete_thread(), return_exceptions=True)
 
     EVENTS.pop(event_id, None)
-    save_events(EVENTS)
+    _last_render.pop(event_id, None)
+    request_save()
 
     await safe_send(interaction, content="🗑️ Event gelöscht.", ephemeral=True)
 
@@ -578,7 +742,7 @@ tree.add_command(event_group)
 # =========================
 @client.event
 async def on_ready():
-    global _scheduler_task
+    global _scheduler_task, _saver_task
     print("🚀 SlotBot ready:", client.user)
 
     # Re-register persistent views for existing events (important after restart)
@@ -602,18 +766,37 @@ async def on_ready():
 
     if _scheduler_task is None or _scheduler_task.done():
         _scheduler_task = asyncio.create_task(scheduler_loop())
+    if _saver_task is None or _saver_task.done():
+        _saver_task = asyncio.create_task(saver_loop())
 
 # =========================
 # Entrypoint
 # =========================
+async def run_bot():
+    # Start health endpoint first -> Render healthcheck always passes even if Discord takes time
+    runner = await start_web()
+    try:
+        async with client:
+            await client.start(DISCORD_TOKEN)
+    finally:
+        await runner.cleanup()
+
 def main():
     if not DISCORD_TOKEN:
         raise RuntimeError("DISCORD_TOKEN fehlt in den Environment Variablen!")
 
-    # Start Flask immediately -> Render healthcheck always passes even if Discord takes time
-    threading.Thread(target=run_flask, daemon=True).start()
+    # client.run() would do this for us; we drive the loop ourselves to share it with aiohttp
+    discord.utils.setup_logging()
+    if uvloop is not None:
+        # libuv-based loop: cheaper socket I/O for the gateway/HTTP traffic
+        asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+    try:
+        asyncio.run(run_bot())
+    except KeyboardInterrupt:
+        pass
 
-    client.run(DISCORD_TOKEN)
+    # Flush anything still waiting in the coalesced saver
+    save_events(EVENTS)
 
 if __name__ == "__main__":
     main()